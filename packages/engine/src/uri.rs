@@ -87,12 +87,11 @@ impl RegelrechtUri {
             });
         }
 
-        // Split on fragment (#) first
-        let (path_part, field) = if let Some(hash_pos) = uri.find('#') {
-            let (path, frag) = uri.split_at(hash_pos);
-            (path, Some(frag[1..].to_string())) // Skip the #
-        } else {
-            (uri, None)
+        // Split on fragment (#) first; the field stays borrowed until the
+        // path has been validated, so malformed URIs allocate nothing.
+        let (path_part, field) = match uri.split_once('#') {
+            Some((path, frag)) => (path, Some(frag)),
+            None => (uri, None),
         };
 
         // Check if it's a regelrecht:// URI
@@ -111,18 +110,15 @@ impl RegelrechtUri {
     }
 
     /// Parse a regelrecht:// URI
-    fn parse_regelrecht_uri(original: &str, path: &str, field: Option<String>) -> Result<Self> {
+    fn parse_regelrecht_uri(original: &str, path: &str, field: Option<&str>) -> Result<Self> {
         // Split path on first /
-        let slash_pos = path.find('/').ok_or_else(|| {
+        let (law_id, output) = path.split_once('/').ok_or_else(|| {
             EngineError::InvalidUri(format!(
                 "Invalid regelrecht URI: must contain law_id/output, got: {}",
                 original
             ))
         })?;
 
-        let (law_id, output) = path.split_at(slash_pos);
-        let output = &output[1..]; // Skip the /
-
         if law_id.is_empty() {
             return Err(EngineError::InvalidUri(format!(
                 "Invalid regelrecht URI: law_id cannot be empty, got: {}",
@@ -140,16 +136,15 @@ impl RegelrechtUri {
             uri: original.to_string(),
             law_id: law_id.to_string(),
             output: output.to_string(),
-            field,
+            field: field.map(str::to_string),
             reference_type: ReferenceType::External,
         })
     }
 
     /// Parse a file path reference (regulation/nl/layer/law_id#field)
-    fn parse_file_path(original: &str, path: &str, field: Option<String>) -> Result<Self> {
-        // Parse path parts: regulation/nl/layer/law_id
-        let parts: Vec<&str> = path.split('/').collect();
-        if parts.len() < 4 {
+    fn parse_file_path(original: &str, path: &str, field: Option<&str>) -> Result<Self> {
+        // Path must have at least four segments: regulation/nl/layer/law_id
+        if path.split('/').nth(3).is_none() {
             return Err(EngineError::InvalidUri(format!(
                 "Invalid file path reference: expected regulation/nl/layer/law_id, got: {}",
                 original
@@ -157,17 +152,17 @@ impl RegelrechtUri {
         }
 
         // Extract law_id (last part of path)
-        let law_id = parts[parts.len() - 1].to_string();
+        let law_id = path.rsplit_once('/').map_or(path, |(_, last)| last);
 
         // For file path references, the output is the field name
         // (we look up the article that produces this output)
-        let output = field.clone().unwrap_or_else(|| law_id.clone());
+        let output = field.unwrap_or(law_id);
 
         Ok(Self {
             uri: original.to_string(),
-            law_id,
-            output,
-            field,
+            law_id: law_id.to_string(),
+            output: output.to_string(),
+            field: field.map(str::to_string),
             reference_type: ReferenceType::External,
         })
     }
@@ -361,6 +356,14 @@ mod tests {
             assert_eq!(uri.field(), Some("heeft_recht_op_zorgtoeslag"));
         }
 
+        #[test]
+        fn test_parse_regelrecht_uri_splits_on_first_separators() {
+            let uri = RegelrechtUri::parse("regelrecht://law/out/put#field#extra").unwrap();
+            assert_eq!(uri.law_id(), "law");
+            assert_eq!(uri.output(), "out/put");
+            assert_eq!(uri.field(), Some("field#extra"));
+        }
+
         #[test]
         fn test_parse_file_path_with_field() {
             let uri = RegelrechtUri::parse(
@@ -3,14 +3,51 @@
 //! Loads all YAML regulation files from the corpus/regulation/nl directory.
 
 use crate::common::regulation_base_path;
-use regelrecht_engine::{EngineError, LawExecutionService};
+use regelrecht_engine::{ArticleBasedLaw, EngineError, LawExecutionService};
+use std::sync::OnceLock;
 use walkdir::WalkDir;
 
+/// Parsed regulation corpus, shared by every scenario in the process.
+///
+/// Each scenario gets a fresh `LawExecutionService`, but the YAML on disk does
+/// not change during a run, so it only needs to be read and parsed once.
+static PARSED_REGULATIONS: OnceLock<Vec<ArticleBasedLaw>> = OnceLock::new();
+
 /// Load all regulation YAML files into the service.
 ///
 /// Scans the `corpus/regulation/nl/` directory (or `REGULATION_PATH` env var base)
-/// and loads all `.yaml` files found.
+/// and loads all `.yaml` files found. Files are parsed on the first call only;
+/// later calls load clones of the cached laws.
 pub fn load_all_regulations(service: &mut LawExecutionService) -> Result<usize, EngineError> {
+    let mut count = 0;
+
+    for law in parsed_regulations()? {
+        match service.load_law_struct(law.clone()) {
+            Ok(()) => count += 1,
+            Err(e) => {
+                tracing::warn!(law_id = %law.id, error = %e, "Failed to load law (skipping)");
+            }
+        }
+    }
+
+    tracing::info!(count = count, "Loaded regulations");
+    Ok(count)
+}
+
+/// Return the parsed regulation corpus, reading it from disk on first use.
+///
+/// Errors are not cached, so a missing directory is reported on every call.
+fn parsed_regulations() -> Result<&'static [ArticleBasedLaw], EngineError> {
+    if let Some(laws) = PARSED_REGULATIONS.get() {
+        return Ok(laws);
+    }
+
+    let laws = parse_all_regulations()?;
+    Ok(PARSED_REGULATIONS.get_or_init(|| laws))
+}
+
+/// Read and parse every `.yaml` file under the regulation directory.
+fn parse_all_regulations() -> Result<Vec<ArticleBasedLaw>, EngineError> {
     let regulation_dir = regulation_base_path().join("nl");
 
     if !regulation_dir.exists() {
@@ -20,7 +57,7 @@ pub fn load_all_regulations(service: &mut LawExecutionService) -> Result<usize,
         )));
     }
 
-    let mut count = 0;
+    let mut laws = Vec::new();
 
     for entry in WalkDir::new(&regulation_dir)
         .follow_links(true)
@@ -35,10 +72,10 @@ pub fn load_all_regulations(service: &mut LawExecutionService) -> Result<usize,
                 EngineError::LoadError(format!("Failed to read {}: {}", path.display(), e))
             })?;
 
-            match service.load_law(&content) {
-                Ok(law_id) => {
-                    tracing::debug!(law_id = %law_id, path = %path.display(), "Loaded law");
-                    count += 1;
+            match ArticleBasedLaw::from_yaml_str(&content) {
+                Ok(law) => {
+                    tracing::debug!(law_id = %law.id, path = %path.display(), "Parsed law");
+                    laws.push(law);
                 }
                 Err(e) => {
                     tracing::warn!(
@@ -52,8 +89,7 @@ pub fn load_all_regulations(service: &mut LawExecutionService) -> Result<usize,
         }
     }
 
-    tracing::info!(count = count, "Loaded regulations");
-    Ok(count)
+    Ok(laws)
 }
 
 /// Get the path to a specific regulation file.
@@ -81,6 +117,18 @@ mod tests {
         assert!(count > 0, "Expected to load at least one regulation");
     }
 
+    #[test]
+    fn test_cached_regulations_load_into_fresh_service() {
+        let mut first = LawExecutionService::new();
+        let first_count = load_all_regulations(&mut first).expect("Failed to load regulations");
+
+        let mut second = LawExecutionService::new();
+        let second_count = load_all_regulations(&mut second).expect("Failed to load regulations");
+
+        assert_eq!(first_count, second_count);
+        assert!(second.has_law("participatiewet"));
+    }
+
     #[test]
     fn test_specific_laws_loaded() {
         let mut service = LawExecutionService::new();
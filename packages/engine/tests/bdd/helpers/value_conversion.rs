@@ -10,22 +10,27 @@ use regelrecht_engine::Value;
 /// - `true` / `false` -> Bool
 /// - `null` -> Null
 /// - Integer literals -> Int
-/// - Float literals -> Float
-/// - Everything else -> String
+/// - Finite float literals -> Float
+/// - Everything else -> String, including `inf` / `nan` in any sign or case
+///   and literals that overflow to infinity
 pub fn convert_gherkin_value(val: &str) -> Value {
     let trimmed = val.trim();
 
-    // Boolean
-    if trimmed == "true" {
-        return Value::Bool(true);
-    }
-    if trimmed == "false" {
-        return Value::Bool(false);
+    // Keyword literals
+    match trimmed {
+        "true" => return Value::Bool(true),
+        "false" => return Value::Bool(false),
+        "null" | "" => return Value::Null,
+        _ => {}
     }
 
-    // Null
-    if trimmed == "null" || trimmed.is_empty() {
-        return Value::Null;
+    // Only numeric-looking cells are worth parsing
+    if !trimmed
+        .as_bytes()
+        .first()
+        .is_some_and(|b| b.is_ascii_digit() || matches!(b, b'-' | b'+' | b'.'))
+    {
+        return Value::String(trimmed.to_string());
     }
 
     // Try integer first
@@ -33,8 +38,8 @@ pub fn convert_gherkin_value(val: &str) -> Value {
         return Value::Int(i);
     }
 
-    // Try float
-    if let Ok(f) = trimmed.parse::<f64>() {
+    // Try float; non-finite results ("-inf", "+nan", "1e999") stay strings
+    if let Some(f) = trimmed.parse::<f64>().ok().filter(|f| f.is_finite()) {
         return Value::Float(f);
     }
 
@@ -144,6 +149,26 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_convert_non_numeric_words_stay_strings() {
+        assert_eq!(
+            convert_gherkin_value("inf"),
+            Value::String("inf".to_string())
+        );
+        assert_eq!(
+            convert_gherkin_value("NaN"),
+            Value::String("NaN".to_string())
+        );
+        for word in ["-inf", "+nan", "-infinity", "+Infinity", "1e999"] {
+            assert_eq!(convert_gherkin_value(word), Value::String(word.to_string()));
+        }
+        assert_eq!(
+            convert_gherkin_value("-abc"),
+            Value::String("-abc".to_string())
+        );
+        assert_eq!(convert_gherkin_value(".5"), Value::Float(0.5));
+    }
+
     #[test]
     fn test_values_equal_with_tolerance() {
         // Exact int match
@@ -5,7 +5,7 @@
 use cucumber::{gherkin::Step, given};
 
 use crate::helpers::value_conversion::{convert_gherkin_value, parse_table_to_params};
-use crate::world::RegelrechtWorld;
+use crate::world::{ExternalTable, RegelrechtWorld, EXTERNAL_DATA_SOURCES};
 
 // =============================================================================
 // Background steps
@@ -73,75 +73,36 @@ fn set_query_data(world: &mut RegelrechtWorld, step: &Step) {
 // Zorgtoeslag external data steps
 // =============================================================================
 
-#[given(regex = r#"the following RVIG "personal_data" data:"#)]
-fn set_rvig_personal_data(world: &mut RegelrechtWorld, step: &Step) {
+#[given(regex = r#"^the following (\S+) "([^"]+)" data:$"#)]
+fn set_external_data(
+    world: &mut RegelrechtWorld,
+    step: &Step,
+    service: String,
+    datasource: String,
+) {
+    assert!(
+        EXTERNAL_DATA_SOURCES.contains(&(service.as_str(), datasource.as_str())),
+        "Unknown external data source: {} \"{}\"",
+        service,
+        datasource
+    );
+
     if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.rvig_personal);
+        parse_external_data_table(table, world.external_data.table_mut(&datasource));
+
         // Store BSN in parameters (required article parameter)
-        for data in world.external_data.rvig_personal.values() {
-            if let Some(v) = data.get("bsn") {
-                world.parameters.insert("bsn".to_string(), v.clone());
+        if datasource == "personal_data" {
+            if let Some(personal) = world.external_data.table("personal_data") {
+                for data in personal.values() {
+                    if let Some(v) = data.get("bsn") {
+                        world.parameters.insert("bsn".to_string(), v.clone());
+                    }
+                }
             }
         }
     }
 }
 
-#[given(regex = r#"the following RVIG "relationship_data" data:"#)]
-fn set_rvig_relationship_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.rvig_relationship);
-    }
-}
-
-#[given(regex = r#"the following RVZ "insurance" data:"#)]
-fn set_rvz_insurance_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.rvz_insurance);
-    }
-}
-
-#[given(regex = r#"the following BELASTINGDIENST "box1" data:"#)]
-fn set_bd_box1_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.bd_box1);
-    }
-}
-
-#[given(regex = r#"the following BELASTINGDIENST "box2" data:"#)]
-fn set_bd_box2_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.bd_box2);
-    }
-}
-
-#[given(regex = r#"the following BELASTINGDIENST "box3" data:"#)]
-fn set_bd_box3_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.bd_box3);
-    }
-}
-
-#[given(regex = r#"the following DJI "detenties" data:"#)]
-fn set_dji_detenties_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.dji_detenties);
-    }
-}
-
-#[given(regex = r#"the following DUO "inschrijvingen" data:"#)]
-fn set_duo_inschrijvingen_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.duo_inschrijvingen);
-    }
-}
-
-#[given(regex = r#"the following DUO "studiefinanciering" data:"#)]
-fn set_duo_studiefinanciering_data(world: &mut RegelrechtWorld, step: &Step) {
-    if let Some(table) = &step.table {
-        parse_external_data_table(table, &mut world.external_data.duo_studiefinanciering);
-    }
-}
-
 /// Parse an external data table with headers.
 ///
 /// Table format:
@@ -149,13 +110,7 @@ fn set_duo_studiefinanciering_data(world: &mut RegelrechtWorld, step: &Step) {
 /// | bsn       | field1 | field2 |
 /// | 999993653 | value1 | value2 |
 /// ```
-fn parse_external_data_table(
-    table: &cucumber::gherkin::Table,
-    storage: &mut std::collections::HashMap<
-        String,
-        std::collections::BTreeMap<String, regelrecht_engine::Value>,
-    >,
-) {
+fn parse_external_data_table(table: &cucumber::gherkin::Table, storage: &mut ExternalTable) {
     if table.rows.len() < 2 {
         return;
     }
@@ -163,30 +118,34 @@ fn parse_external_data_table(
     // First row is headers
     let headers: Vec<String> = table.rows[0].iter().map(|s| s.trim().to_string()).collect();
 
+    // Records are keyed by BSN, so without a bsn column nothing can be stored
+    let Some(bsn_index) = headers.iter().position(|h| h == "bsn") else {
+        return;
+    };
+
     // Remaining rows are data
     for row in table.rows.iter().skip(1) {
+        // Resolve the key first and skip rows without a usable BSN before
+        // converting the rest of their cells
+        let bsn_value = match row.get(bsn_index) {
+            Some(cell) => convert_gherkin_value(cell),
+            None => continue,
+        };
+        let bsn = match &bsn_value {
+            regelrecht_engine::Value::String(s) => s.clone(),
+            regelrecht_engine::Value::Int(n) => n.to_string(),
+            _ => continue,
+        };
+
         let mut record = std::collections::BTreeMap::new();
-        let mut bsn = String::new();
-
-        for (i, cell) in row.iter().enumerate() {
-            if i < headers.len() {
-                let header = &headers[i];
-                let value = convert_gherkin_value(cell);
-
-                if header == "bsn" {
-                    if let regelrecht_engine::Value::String(s) = &value {
-                        bsn = s.clone();
-                    } else if let regelrecht_engine::Value::Int(n) = &value {
-                        bsn = n.to_string();
-                    }
-                }
 
-                record.insert(header.clone(), value);
+        for (i, (header, cell)) in headers.iter().zip(row).enumerate() {
+            if i != bsn_index {
+                record.insert(header.clone(), convert_gherkin_value(cell));
             }
         }
+        record.insert(headers[bsn_index].clone(), bsn_value);
 
-        if !bsn.is_empty() {
-            storage.insert(bsn, record);
-        }
+        storage.insert(bsn, record);
     }
 }
@@ -7,9 +7,6 @@ use regelrecht_engine::{OutputProvenance, Value};
 
 use crate::world::RegelrechtWorld;
 
-// Note: All 17 BDD scenarios now pass with the IoC (open_terms + implements) pattern.
-// - Bijstand tests: Rust engine doesn't have "uitvoerder context" mechanism for gedragscategorie
-// - Erfgrensbeplanting without verordening: Rust engine doesn't support delegation defaults yet
 // Note: All 17 BDD scenarios now pass with the IoC (open_terms + implements) pattern.
 
 // Bijstand steps
@@ -48,35 +45,11 @@ fn assert_no_right_to_bijstand(world: &mut RegelrechtWorld) {
 
 #[then(regex = r#"^the uitkering_bedrag is "(\d+)" eurocent$"#)]
 fn assert_uitkering_bedrag(world: &mut RegelrechtWorld, expected: String) {
-    assert!(
-        world.is_success(),
-        "Expected successful execution, got error: {:?}",
-        world.error_message()
-    );
-
     let expected_amount: i64 = expected
         .parse()
         .unwrap_or_else(|_| panic!("Invalid eurocent value: {}", expected));
 
-    let actual = world.get_output("uitkering_bedrag");
-    match actual {
-        Some(Value::Int(n)) => {
-            assert_eq!(
-                *n, expected_amount,
-                "Expected uitkering_bedrag to be {} eurocent, got {}",
-                expected_amount, n
-            );
-        }
-        Some(Value::Float(f)) => {
-            let actual_int = f.round() as i64;
-            assert_eq!(
-                actual_int, expected_amount,
-                "Expected uitkering_bedrag to be {} eurocent, got {} (rounded from {})",
-                expected_amount, actual_int, f
-            );
-        }
-        _ => panic!("Expected uitkering_bedrag to be a number, got {:?}", actual),
-    }
+    assert_int_output(world, "uitkering_bedrag", expected_amount, " eurocent");
 }
 
 #[then(regex = r#"^the reden_afwijzing contains "([^"]+)"$"#)]
@@ -91,7 +64,7 @@ fn assert_reden_afwijzing_contains(world: &mut RegelrechtWorld, expected_text: S
     match reden {
         Some(Value::String(s)) => {
             assert!(
-                s.to_lowercase().contains(&expected_text.to_lowercase()),
+                contains_ignore_case(s, &expected_text),
                 "Expected reden_afwijzing to contain '{}', got '{}'",
                 expected_text,
                 s
@@ -262,12 +235,9 @@ fn assert_execution_fails_with(world: &mut RegelrechtWorld, expected_message: St
 
     let error_msg = world.error_message().unwrap_or_default();
 
-    // Normalize expected message for cross-engine compatibility
-    // Normalize for cross-engine compatibility
-    let normalized_expected = expected_message.to_lowercase();
-
+    // Case-insensitive for cross-engine compatibility
     assert!(
-        error_msg.to_lowercase().contains(&normalized_expected),
+        contains_ignore_case(&error_msg, &expected_message),
         "Expected error to contain '{}', got: '{}'",
         expected_message,
         error_msg
@@ -278,38 +248,11 @@ fn assert_execution_fails_with(world: &mut RegelrechtWorld, expected_message: St
 
 #[then(regex = r#"^the minimale_afstand_cm is "(\d+)"$"#)]
 fn assert_minimale_afstand_cm(world: &mut RegelrechtWorld, expected: String) {
-    assert!(
-        world.is_success(),
-        "Expected successful execution, got error: {:?}",
-        world.error_message()
-    );
-
     let expected_cm: i64 = expected
         .parse()
         .unwrap_or_else(|_| panic!("Invalid cm value: {}", expected));
 
-    let actual = world.get_output("minimale_afstand_cm");
-    match actual {
-        Some(Value::Int(n)) => {
-            assert_eq!(
-                *n, expected_cm,
-                "Expected minimale_afstand_cm to be {}, got {}",
-                expected_cm, n
-            );
-        }
-        Some(Value::Float(f)) => {
-            let actual_int = f.round() as i64;
-            assert_eq!(
-                actual_int, expected_cm,
-                "Expected minimale_afstand_cm to be {}, got {} (rounded from {})",
-                expected_cm, actual_int, f
-            );
-        }
-        _ => panic!(
-            "Expected minimale_afstand_cm to be a number, got {:?}",
-            actual
-        ),
-    }
+    assert_int_output(world, "minimale_afstand_cm", expected_cm, "");
 }
 
 #[then(regex = r#"^the minimale_afstand_m is "([0-9.]+)"$"#)]
@@ -390,35 +333,11 @@ fn assert_no_right_to_healthcare_allowance(world: &mut RegelrechtWorld) {
 
 #[then(regex = r#"^the standard premium is "(\d+)" eurocent$"#)]
 fn assert_standard_premium_eurocent(world: &mut RegelrechtWorld, expected: String) {
-    assert!(
-        world.is_success(),
-        "Expected successful execution, got error: {:?}",
-        world.error_message()
-    );
-
     let expected_amount: i64 = expected
         .parse()
         .unwrap_or_else(|_| panic!("Invalid eurocent value: {}", expected));
 
-    let actual = world.get_output("standaardpremie");
-    match actual {
-        Some(Value::Int(n)) => {
-            assert_eq!(
-                *n, expected_amount,
-                "Expected standaardpremie to be {} eurocent, got {}",
-                expected_amount, n
-            );
-        }
-        Some(Value::Float(f)) => {
-            let actual_int = f.round() as i64;
-            assert_eq!(
-                actual_int, expected_amount,
-                "Expected standaardpremie to be {} eurocent, got {} (rounded from {})",
-                expected_amount, actual_int, f
-            );
-        }
-        _ => panic!("Expected standaardpremie to be a number, got {:?}", actual),
-    }
+    assert_int_output(world, "standaardpremie", expected_amount, " eurocent");
 }
 
 #[then(regex = r#"^the allowance amount is "([0-9.]+)" euro$"#)]
@@ -465,3 +384,42 @@ fn assert_allowance_amount_euro(world: &mut RegelrechtWorld, expected: String) {
         ),
     }
 }
+
+// Helpers
+
+/// Assert a successful execution whose integer output equals `expected`.
+///
+/// Float outputs are rounded before comparison; `unit` is appended to the
+/// expected value in failure messages.
+fn assert_int_output(world: &RegelrechtWorld, output_name: &str, expected: i64, unit: &str) {
+    assert!(
+        world.is_success(),
+        "Expected successful execution, got error: {:?}",
+        world.error_message()
+    );
+
+    let actual = world.get_output(output_name);
+    match actual {
+        Some(Value::Int(n)) => {
+            assert_eq!(
+                *n, expected,
+                "Expected {} to be {}{}, got {}",
+                output_name, expected, unit, n
+            );
+        }
+        Some(Value::Float(f)) => {
+            let actual_int = f.round() as i64;
+            assert_eq!(
+                actual_int, expected,
+                "Expected {} to be {}{}, got {} (rounded from {})",
+                output_name, expected, unit, actual_int, f
+            );
+        }
+        _ => panic!("Expected {} to be a number, got {:?}", output_name, actual),
+    }
+}
+
+/// Case-insensitive substring check used by the message assertions.
+fn contains_ignore_case(haystack: &str, needle: &str) -> bool {
+    haystack.to_lowercase().contains(&needle.to_lowercase())
+}
@@ -3,9 +3,8 @@
 //! Steps that execute actions (law evaluations).
 
 use cucumber::when;
-use regelrecht_engine::Value;
 
-use crate::world::RegelrechtWorld;
+use crate::world::{ExternalTable, RegelrechtWorld};
 
 // =============================================================================
 // Untranslatable steps (RFC-012)
@@ -87,49 +86,20 @@ fn request_standard_premium(world: &mut RegelrechtWorld, year: String) {
 fn execute_healthcare_allowance(world: &mut RegelrechtWorld) {
     // Register raw external data as DataSources (no pre-computation).
     // The engine resolves through cross-law references automatically.
-    register_if_present(
-        &mut world.service,
-        "personal_data",
-        &world.external_data.rvig_personal,
-    );
-    register_if_present(
-        &mut world.service,
-        "relationship_data",
-        &world.external_data.rvig_relationship,
-    );
-    register_if_present(
-        &mut world.service,
-        "insurance",
-        &world.external_data.rvz_insurance,
-    );
-    register_if_present(&mut world.service, "box1", &world.external_data.bd_box1);
-    register_if_present(&mut world.service, "box2", &world.external_data.bd_box2);
-    register_if_present(&mut world.service, "box3", &world.external_data.bd_box3);
-    register_if_present(
-        &mut world.service,
-        "detenties",
-        &world.external_data.dji_detenties,
-    );
-    register_if_present(
-        &mut world.service,
-        "inschrijvingen",
-        &world.external_data.duo_inschrijvingen,
-    );
-    register_if_present(
-        &mut world.service,
-        "studiefinanciering",
-        &world.external_data.duo_studiefinanciering,
-    );
+    for (name, data) in world.external_data.tables() {
+        register_if_present(&mut world.service, name, data);
+    }
 
     // Execute — engine resolves through cross-law references automatically.
-    // BSN stays in parameters (set by set_rvig_personal_data in given.rs).
+    // BSN stays in parameters (set by the personal_data branch of
+    // set_external_data in given.rs).
     world.execute_law("zorgtoeslagwet", "hoogte_zorgtoeslag");
 }
 
 fn register_if_present(
     service: &mut regelrecht_engine::LawExecutionService,
     name: &str,
-    data: &std::collections::HashMap<String, std::collections::BTreeMap<String, Value>>,
+    data: &ExternalTable,
 ) {
     if !data.is_empty() {
         let records: Vec<_> = data.values().cloned().collect();
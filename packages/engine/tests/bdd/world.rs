@@ -10,10 +10,17 @@ use std::collections::{BTreeMap, HashMap};
 use std::fmt;
 use std::path::PathBuf;
 use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::OnceLock;
 
 /// Global scenario counter for unique trace file names.
 static SCENARIO_COUNTER: AtomicUsize = AtomicUsize::new(0);
 
+/// Calculation date used until a scenario sets its own.
+const DEFAULT_CALCULATION_DATE: &str = "2024-01-01";
+
+/// Whether tracing was requested, read from the environment once per run.
+static TRACE_ENABLED: OnceLock<bool> = OnceLock::new();
+
 use crate::helpers::regulation_loader::load_all_regulations;
 
 /// Test world that holds state across steps in a Cucumber scenario.
@@ -50,27 +57,52 @@ impl fmt::Debug for RegelrechtWorld {
     }
 }
 
+/// Records of one external data source, keyed by BSN.
+pub type ExternalTable = HashMap<String, BTreeMap<String, Value>>;
+
+/// External data tables accepted by the given steps, as (service, datasource).
+///
+/// All tables are registered at the same priority and the first source with a
+/// field wins, so this fixed order (not the order of the Given steps) decides
+/// which table answers when two tables share a column.
+pub const EXTERNAL_DATA_SOURCES: &[(&str, &str)] = &[
+    ("RVIG", "personal_data"),
+    ("RVIG", "relationship_data"),
+    ("RVZ", "insurance"),
+    ("BELASTINGDIENST", "box1"),
+    ("BELASTINGDIENST", "box2"),
+    ("BELASTINGDIENST", "box3"),
+    ("DJI", "detenties"),
+    ("DUO", "inschrijvingen"),
+    ("DUO", "studiefinanciering"),
+];
+
 /// External data sources (mocked for testing)
+///
+/// Tables are keyed by data source name (e.g. `personal_data`, `box1`).
 #[derive(Debug, Default, Clone)]
 pub struct ExternalData {
-    /// RVIG personal_data
-    pub rvig_personal: HashMap<String, BTreeMap<String, Value>>,
-    /// RVIG relationship_data
-    pub rvig_relationship: HashMap<String, BTreeMap<String, Value>>,
-    /// RVZ insurance data
-    pub rvz_insurance: HashMap<String, BTreeMap<String, Value>>,
-    /// Belastingdienst box1 data
-    pub bd_box1: HashMap<String, BTreeMap<String, Value>>,
-    /// Belastingdienst box2 data
-    pub bd_box2: HashMap<String, BTreeMap<String, Value>>,
-    /// Belastingdienst box3 data
-    pub bd_box3: HashMap<String, BTreeMap<String, Value>>,
-    /// DJI detenties data
-    pub dji_detenties: HashMap<String, BTreeMap<String, Value>>,
-    /// DUO inschrijvingen data
-    pub duo_inschrijvingen: HashMap<String, BTreeMap<String, Value>>,
-    /// DUO studiefinanciering data
-    pub duo_studiefinanciering: HashMap<String, BTreeMap<String, Value>>,
+    tables: HashMap<String, ExternalTable>,
+}
+
+impl ExternalData {
+    /// Get the table for a data source, creating it on first use.
+    pub fn table_mut(&mut self, name: &str) -> &mut ExternalTable {
+        self.tables.entry(name.to_string()).or_default()
+    }
+
+    /// Get the table for a data source, if it was given.
+    pub fn table(&self, name: &str) -> Option<&ExternalTable> {
+        self.tables.get(name)
+    }
+
+    /// Iterate over the given tables in `EXTERNAL_DATA_SOURCES` order, which is
+    /// the order they are registered with the engine.
+    pub fn tables(&self) -> impl Iterator<Item = (&str, &ExternalTable)> {
+        EXTERNAL_DATA_SOURCES
+            .iter()
+            .filter_map(|&(_, name)| self.table(name).map(|table| (name, table)))
+    }
 }
 
 impl Default for RegelrechtWorld {
@@ -91,7 +123,7 @@ impl RegelrechtWorld {
 
         Self {
             service,
-            calculation_date: "2024-01-01".to_string(),
+            calculation_date: DEFAULT_CALCULATION_DATE.to_string(),
             parameters: BTreeMap::new(),
             result: None,
             error: None,
@@ -102,7 +134,7 @@ impl RegelrechtWorld {
     /// Clear state between scenarios (but keep service loaded)
     #[allow(dead_code)]
     pub fn reset_scenario_state(&mut self) {
-        self.calculation_date = "2024-01-01".to_string();
+        self.calculation_date = DEFAULT_CALCULATION_DATE.to_string();
         self.parameters.clear();
         self.result = None;
         self.error = None;
@@ -111,7 +143,8 @@ impl RegelrechtWorld {
 
     /// Returns true if trace output is enabled via the `TRACE` env var.
     fn trace_enabled() -> bool {
-        std::env::var("TRACE").is_ok_and(|v| !v.is_empty() && v != "0")
+        *TRACE_ENABLED
+            .get_or_init(|| std::env::var("TRACE").is_ok_and(|v| !v.is_empty() && v != "0"))
     }
 
     /// Execute a law for a single output. Delegates to `execute_law_multi`.
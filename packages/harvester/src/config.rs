@@ -29,19 +29,16 @@ pub const SCHEMA_URL: &str =
 pub const TEXT_WRAP_WIDTH: usize = 115;
 
 /// BWB ID pattern: BWBR followed by 7 digits.
+///
+/// Digit classes are spelled `[0-9]` because `\d` matches any Unicode digit.
 #[allow(clippy::expect_used)] // Static regex that is guaranteed to be valid
 static BWB_ID_PATTERN: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"^BWBR\d{7}$").expect("valid regex"));
+    LazyLock::new(|| Regex::new(r"^BWBR[0-9]{7}$").expect("valid regex"));
 
 /// CVDR ID pattern: CVDR followed by 3 or more digits.
 #[allow(clippy::expect_used)] // Static regex that is guaranteed to be valid
 static CVDR_ID_PATTERN: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"^CVDR\d{3,}$").expect("valid regex"));
-
-/// Date pattern: YYYY-MM-DD.
-#[allow(clippy::expect_used)] // Static regex that is guaranteed to be valid
-static DATE_PATTERN: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"^\d{4}-\d{2}-\d{2}$").expect("valid regex"));
+    LazyLock::new(|| Regex::new(r"^CVDR[0-9]{3,}$").expect("valid regex"));
 
 /// Validate BWB ID format.
 ///
@@ -87,13 +84,8 @@ pub fn validate_bwb_id(bwb_id: &str) -> Result<()> {
 /// assert!(validate_date("2025-13-01").is_err()); // Invalid month
 /// ```
 pub fn validate_date(date_str: &str) -> Result<()> {
-    if !DATE_PATTERN.is_match(date_str) {
-        return Err(HarvesterError::InvalidDate(date_str.to_string()));
-    }
-
-    // Parse and validate it's a real date
-    let parsed_date = chrono::NaiveDate::parse_from_str(date_str, "%Y-%m-%d")
-        .map_err(|_| HarvesterError::InvalidDate(date_str.to_string()))?;
+    let parsed_date = parse_iso_date(date_str)
+        .ok_or_else(|| HarvesterError::InvalidDate(date_str.to_string()))?;
 
     // Reject future dates - BWB won't have consolidated versions for them
     let today = chrono::Local::now().date_naive();
@@ -106,6 +98,26 @@ pub fn validate_date(date_str: &str) -> Result<()> {
     Ok(())
 }
 
+/// Parse a strict `YYYY-MM-DD` date.
+///
+/// Checks the fixed layout byte by byte instead of going through a regex and
+/// a chrono format string, then lets chrono reject impossible dates.
+fn parse_iso_date(date_str: &str) -> Option<chrono::NaiveDate> {
+    let bytes = date_str.as_bytes();
+    if bytes.len() != 10 || bytes[4] != b'-' || bytes[7] != b'-' {
+        return None;
+    }
+
+    let number = |digits: &[u8]| {
+        digits.iter().try_fold(0u32, |acc, b| {
+            b.is_ascii_digit().then(|| acc * 10 + u32::from(b - b'0'))
+        })
+    };
+
+    let year = i32::try_from(number(&bytes[0..4])?).ok()?;
+    chrono::NaiveDate::from_ymd_opt(year, number(&bytes[5..7])?, number(&bytes[8..10])?)
+}
+
 /// Build manifest URL for a law.
 ///
 /// # Arguments
@@ -159,7 +171,7 @@ pub fn content_url(bwb_id: &str, date: &str) -> String {
         "bwb_id should be validated before calling content_url"
     );
     debug_assert!(
-        DATE_PATTERN.is_match(date),
+        parse_iso_date(date).is_some(),
         "date should be validated before calling content_url"
     );
     format!("{BWB_REPOSITORY_URL}/{bwb_id}/{date}_0/xml/{bwb_id}_{date}_0.xml")
@@ -303,6 +315,7 @@ mod tests {
         assert!(validate_bwb_id("BWBR00184512").is_err()); // 8 digits
         assert!(validate_bwb_id("BWBX0018451").is_err()); // Wrong prefix
         assert!(validate_bwb_id("bwbr0018451").is_err()); // Lowercase
+        assert!(validate_bwb_id("BWBR001845\u{0661}").is_err()); // Non-ASCII digit
     }
 
     #[test]
@@ -310,6 +323,7 @@ mod tests {
         assert!(validate_date("2025-01-01").is_ok());
         assert!(validate_date("2024-12-31").is_ok());
         assert!(validate_date("2000-06-15").is_ok());
+        assert!(validate_date("2024-02-29").is_ok()); // Leap day
     }
 
     #[test]
@@ -325,6 +339,22 @@ mod tests {
         assert!(validate_date("2025-13-01").is_err()); // Invalid month
         assert!(validate_date("2025-02-30").is_err()); // Invalid day
         assert!(validate_date("2025-00-01").is_err()); // Zero month
+        assert!(validate_date("2023-02-29").is_err()); // Not a leap year
+    }
+
+    // chrono's format parser already rejected these; this guards the
+    // hand-written byte check that replaced it.
+    #[test]
+    fn test_validate_date_rejects_malformed_digits() {
+        // Ten bytes long, so these reach the per-field digit check
+        assert!(validate_date("20x5-01-01").is_err()); // Year
+        assert!(validate_date("2025-0a-01").is_err()); // Month
+        assert!(validate_date("2025-01-0x").is_err()); // Day
+        assert!(validate_date("+025-01-01").is_err()); // Sign in year
+
+        // Multi-byte digits fail the length check first
+        assert!(validate_date("2025-0\u{0661}-01").is_err());
+        assert!(validate_date("2025-01-0\u{0661}").is_err());
     }
 
     #[test]
@@ -481,6 +511,7 @@ mod tests {
         assert!(validate_cvdr_id("CVDR12").is_err()); // Only 2 digits
         assert!(validate_cvdr_id("BWBR0018451").is_err()); // BWB, not CVDR
         assert!(validate_cvdr_id("cvdr681386").is_err()); // Lowercase
+        assert!(validate_cvdr_id("CVDR\u{0661}\u{0662}\u{0663}").is_err()); // Non-ASCII digits
     }
 
     #[test]
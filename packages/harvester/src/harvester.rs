@@ -53,11 +53,15 @@ pub async fn download_law_with_max_size(
 
     let max_size_bytes = max_size_mb * 1024 * 1024;
 
-    // Download and parse WTI metadata
-    let wti_result = download_wti(client, bwb_id).await?;
-
-    // Download content XML
-    let content_xml = download_content_xml(client, bwb_id, date, max_size_bytes).await?;
+    // Download WTI metadata and content XML concurrently; they are independent
+    // requests. Check WTI first so an unknown BWB ID always reports the WTI
+    // error, regardless of which request finishes first.
+    let (wti_result, content_xml) = tokio::join!(
+        download_wti(client, bwb_id),
+        download_content_xml(client, bwb_id, date, max_size_bytes),
+    );
+    let wti_result = wti_result?;
+    let content_xml = content_xml?;
 
     // Parse articles from content
     let parsed = parse_articles(&content_xml, bwb_id, date)?;
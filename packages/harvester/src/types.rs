@@ -3,9 +3,7 @@
 //! These types represent Dutch legal documents and their components,
 //! matching the Python harvester's `models.py`.
 
-use regex::Regex;
 use serde::{Deserialize, Serialize};
-use std::sync::LazyLock;
 use unicode_normalization::UnicodeNormalization;
 
 use crate::config::wetten_url;
@@ -97,16 +95,6 @@ pub struct LawMetadata {
     pub scope_code: Option<String>,
 }
 
-/// Regex for slug generation - matches non-word characters.
-#[allow(clippy::expect_used)] // Static regex that is guaranteed to be valid
-static SLUG_NON_WORD: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"[^\w\s-]").expect("valid regex"));
-
-/// Regex for slug generation - matches whitespace and dashes.
-#[allow(clippy::expect_used)] // Static regex that is guaranteed to be valid
-static SLUG_SPACE_DASH: LazyLock<Regex> =
-    LazyLock::new(|| Regex::new(r"[-\s]+").expect("valid regex"));
-
 impl LawMetadata {
     /// Generate a URL-friendly slug from the title.
     ///
@@ -131,17 +119,29 @@ impl LawMetadata {
     /// ```
     #[must_use]
     pub fn to_slug(&self) -> String {
+        let mut slug = String::with_capacity(self.title.len());
+        let mut pending_separator = false;
+
         // Normalize using NFKD to decompose accented characters,
-        // then filter to ASCII only (this removes the combining diacritics)
-        let text: String = self
-            .title
-            .to_lowercase()
-            .nfkd()
-            .filter(|c| c.is_ascii())
-            .collect();
-        let text = SLUG_NON_WORD.replace_all(&text, "");
-        let text = SLUG_SPACE_DASH.replace_all(&text, "_");
-        text.trim_matches('_').to_string()
+        // then filter to ASCII only (this removes the combining diacritics).
+        // Word characters are kept, runs of dashes and whitespace become a
+        // single underscore, and everything else is dropped without breaking
+        // a run.
+        for c in self.title.to_lowercase().nfkd().filter(char::is_ascii) {
+            match c {
+                'a'..='z' | 'A'..='Z' | '0'..='9' | '_' => {
+                    if pending_separator {
+                        slug.push('_');
+                        pending_separator = false;
+                    }
+                    slug.push(c);
+                }
+                '-' | ' ' | '\t'..='\r' => pending_separator = true,
+                _ => {}
+            }
+        }
+
+        slug.trim_matches('_').to_string()
     }
 }
 
@@ -438,6 +438,21 @@ mod tests {
         assert_eq!(metadata.to_slug(), "wet_test_special");
     }
 
+    #[test]
+    fn test_law_metadata_to_slug_separator_runs() {
+        let metadata = LawMetadata {
+            bwb_id: "BWBR0000000".to_string(),
+            cvdr_id: None,
+            title: " Wet -- (a)\t! - b_c ".to_string(),
+            regulatory_layer: RegulatoryLayer::Wet,
+            publication_date: None,
+            effective_date: None,
+            creator: None,
+            scope_code: None,
+        };
+        assert_eq!(metadata.to_slug(), "wet_a_b_c");
+    }
+
     #[test]
     fn test_law_metadata_to_slug_diacritics() {
         let metadata = LawMetadata {
@@ -106,8 +106,7 @@ struct YamlLaw {
 }
 
 /// Generate a schema-compliant YAML structure from a Law object.
-fn generate_yaml_struct(law: &Law, effective_date: &str) -> YamlLaw {
-    let law_id = law.metadata.to_slug();
+fn generate_yaml_struct(law: &Law, law_id: String, effective_date: &str) -> YamlLaw {
     let is_cvdr = law.metadata.cvdr_id.is_some();
 
     // Convert preamble if present
@@ -352,7 +351,12 @@ fn fix_yaml_quoting(yaml: &str) -> String {
 
 /// Generate YAML string from a Law object.
 pub fn generate_yaml(law: &Law, effective_date: &str) -> Result<String> {
-    let yaml_struct = generate_yaml_struct(law, effective_date);
+    generate_yaml_with_id(law, law.metadata.to_slug(), effective_date)
+}
+
+/// Generate YAML string from a Law object whose slug is already known.
+fn generate_yaml_with_id(law: &Law, law_id: String, effective_date: &str) -> Result<String> {
+    let yaml_struct = generate_yaml_struct(law, law_id, effective_date);
     let yaml_string = serde_yaml_ng::to_string(&yaml_struct)?;
 
     // Post-process for yamllint compliance
@@ -390,8 +394,8 @@ pub fn save_yaml(law: &Law, effective_date: &str, output_base: Option<&Path>) ->
     let output_file = output_dir.join(format!("{effective_date}.yaml"));
     let temp_file = output_dir.join(format!(".{effective_date}.yaml.tmp"));
 
-    // Generate YAML content
-    let content = generate_yaml(law, effective_date)?;
+    // Generate YAML content, reusing the slug computed above
+    let content = generate_yaml_with_id(law, law_id, effective_date)?;
 
     // Write to temp file first, then sync and rename for atomicity
     {